@@ -0,0 +1,46 @@
+"""JSON helpers for persisted app data (plan and parking files)."""
+
+import json
+import os
+import threading
+from typing import Any, Union
+
+try:
+    # Optional speedup; stdlib json is the fallback.
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads_json(raw: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes; errors are json.JSONDecodeError (or a subclass)."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes with a two-space indent."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write data to path so readers see either the old or the new file.
+
+    The payload goes to a per-thread temp file in a single write, is fsynced,
+    and then replaces path. Errors propagate after the temp file is removed.
+    """
+    payload = dumps_json(data)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import os
 
 
 def resolve_data_root() -> str:
     """Return the root directory for persisted app data."""
     data_dir = os.getenv("ADHD_DATA_DIR")
+    if data_dir and not os.path.isabs(data_dir):
+        # Relative paths depend on the cwd, so they are resolved every time.
+        return os.path.abspath(data_dir)
+    return _data_root(data_dir or None)
+
+
+@functools.lru_cache(maxsize=8)
+def _data_root(data_dir: str | None) -> str:
+    # Keyed on the env value: ADHD_DATA_DIR may be set after import (create_app).
     if data_dir:
         return os.path.abspath(data_dir)
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,11 @@
+"""Worker pool sizing from environment knobs."""
+
+import os
+
+
+def worker_count(env_name: str, default: int = 1) -> int:
+    """Read a positive worker count from the environment, else default."""
+    try:
+        return max(1, int(os.getenv(env_name, default)))
+    except (TypeError, ValueError):
+        return default
@@ -5,6 +5,7 @@ import re
 import subprocess
 from typing import Any, Dict, List, Optional, Tuple
 
+from core.jsonio import write_json_atomic
 from core.paths import resolve_data_root
 from tools.plan_tools_v2 import PlanManager
 from tools.reward_tools import RewardToolkit
@@ -313,8 +314,8 @@ class FocusToolkit:
             target["status"] = "done"
             target["completed_at"] = datetime.datetime.now().astimezone().isoformat()
             try:
-                with open(path, "w") as f:
-                    json.dump(tasks, f, ensure_ascii=False, indent=2)
+                # Not plan_manager._write_tasks: that would re-take _file_lock.
+                write_json_atomic(path, tasks)
             except Exception as exc:
                 return f"❌ Write failed: {exc}"
         finally:
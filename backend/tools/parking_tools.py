@@ -1,22 +1,30 @@
 """Shared parking lot service for focus/orchestration agents."""
 
-import datetime
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
 import os
+import re
+import secrets
 import threading
-import uuid
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Optional, TextIO
 
 from agents.model_config import resolve_model
+from core.jsonio import loads_json, write_json_atomic
 from core.paths import resolve_data_root
+from core.workers import worker_count
 
 try:
-    # Preferred package name (avoids runtime warning in duckduckgo_search)
-    from ddgs import DDGS  # type: ignore
-except ImportError:
-    from duckduckgo_search import DDGS  # type: ignore
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
 
 
 class TaskStatus(str, Enum):
@@ -32,6 +40,73 @@ class TaskType(str, Enum):
     TODO = "todo"
 
 
+# Plain-string aliases so hot paths skip the enum member/.value lookups.
+_PENDING = TaskStatus.PENDING.value
+_PROCESSING = TaskStatus.PROCESSING.value
+_COMPLETED = TaskStatus.COMPLETED.value
+_FAILED = TaskStatus.FAILED.value
+_SEARCH = TaskType.SEARCH.value
+_MEMO = TaskType.MEMO.value
+
+
+_URL_PREFIXES = ("http://", "https://")
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_CLOCK_FORMAT = "%H:%M:%S"
+_SEARCH_HEADER = "🔍 Search results:"
+_SEARCH_CACHE_TTL = 24 * 60 * 60
+_WS_RE = re.compile(r"\s+")
+# A non-empty line, matched from its first non-space character.
+_LOG_LINE_RE = re.compile(r"\S[^\r\n]*")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ddgs() -> Any:
+    """Import the DDG client on first search; memo/todo-only use never pays for it."""
+    try:
+        # Preferred package name (avoids runtime warning in duckduckgo_search)
+        from ddgs import DDGS  # type: ignore
+    except ImportError:
+        from duckduckgo_search import DDGS  # type: ignore
+    return DDGS
+
+
+def _is_url(text: str) -> bool:
+    """Scheme check on the prefix only; avoids lowering the whole query."""
+    return text[:8].lower().startswith(_URL_PREFIXES)
+
+
+def _trunc(text: str, limit: int, ellipsis: str = "...") -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + ellipsis
+
+
+def _summarize_logged(content: str, task: Dict[str, Any]) -> str:
+    return f"📝 \"{content}\" - logged"
+
+
+def _summarize_completed(content: str, task: Dict[str, Any]) -> str:
+    result = task.get("result")
+    if not result:
+        return _summarize_logged(content, task)
+    return f"✅ \"{content}\"\n   → {_trunc(result, 200)}"
+
+
+def _summarize_pending(content: str, task: Dict[str, Any]) -> str:
+    return f"⏳ \"{content}\" - still processing"
+
+
+def _summarize_failed(content: str, task: Dict[str, Any]) -> str:
+    return f"❌ \"{content}\" - failed"
+
+
+# Per-status renderers for get_session_summary; unknown statuses read as logged.
+_SUMMARY_TEMPLATES = {
+    _COMPLETED: _summarize_completed,
+    _PENDING: _summarize_pending,
+    _FAILED: _summarize_failed,
+}
+
+
 class ParkingService:
     """Core parking service that stores thoughts and runs optional background search."""
 
@@ -41,33 +116,61 @@ class ParkingService:
         os.makedirs(self.parking_dir, exist_ok=True)
 
         self._current_file = os.path.join(self.parking_dir, "current_parking.json")
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._store_lock_file = f"{self._current_file}.lock"
+        self._search_cache_dir = os.path.join(self.brain_dir, "search_cache")
         self._session_id: Optional[str] = None
         self._lock = threading.RLock()
+        # Background work runs on one event loop thread; blocking network and file
+        # calls are pushed to worker threads so searches run concurrently.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="parking-loop", daemon=True
+        )
+        self._loop_thread.start()
+        # One queue per backend so slow web fetches never hold up DDG searches.
+        # Search keeps the two workers the shared pool used to have.
+        self._executors: Dict[str, ThreadPoolExecutor] = {
+            "search": ThreadPoolExecutor(
+                max_workers=worker_count("ADHD_PARKING_SEARCH_WORKERS", 2),
+                thread_name_prefix="parking-search",
+            ),
+            "webfetch": ThreadPoolExecutor(
+                max_workers=worker_count("ADHD_PARKING_WEBFETCH_WORKERS"),
+                thread_name_prefix="parking-webfetch",
+            ),
+            # Store and log writes block on file locks, so keep them off the loop.
+            "store": ThreadPoolExecutor(max_workers=1, thread_name_prefix="parking-store"),
+        }
+        # Only touched from the loop thread, so no lock is needed.
+        self._search_futures: Dict[str, "asyncio.Future[str]"] = {}
+        # Daily log handle is kept open and reopened only when the date rolls over.
+        self._log_fh: Optional[TextIO] = None
+        self._log_date: Optional[str] = None
+        atexit.register(self._close_logs)
 
     # ── Public API ─────────────────────────────────────────────
 
     def dispatch_task(
         self,
         content: str,
-        task_type: str = TaskType.SEARCH.value,
+        task_type: str = _SEARCH,
         source: str = "unknown",
         run_async: bool = True,
     ) -> str:
         """
         Primary entry: stash a thought or query, optionally processed in background.
         """
-        normalized_type = (task_type or TaskType.SEARCH.value).lower()
-        task_id = str(uuid.uuid4())[:8]
-        now = datetime.datetime.now()
+        normalized_type = (task_type or _SEARCH).lower()
+        task_id = secrets.token_hex(4)
+        now = time.localtime()
 
         task = {
             "id": task_id,
             "content": content,
             "type": normalized_type,
             "source": source,
-            "status": TaskStatus.PENDING.value,
-            "created_at": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "status": _PENDING,
+            "created_at": time.strftime(_TIMESTAMP_FORMAT, now),
             "session_id": self._session_id,
             "result": None,
             "error": None,
@@ -75,16 +178,15 @@ class ParkingService:
 
         self._append_task(task)
         self._log_to_daily(
-            f"[{now.strftime('%H:%M:%S')}] 📥 Received: {content} (from {source})"
+            f"[{time.strftime(_CLOCK_FORMAT, now)}] 📥 Received: {content} (from {source})"
         )
 
-        if run_async and normalized_type == TaskType.SEARCH.value:
+        if run_async and normalized_type == _SEARCH:
             # Fire-and-forget search so it never blocks focus flow.
-            self._executor.submit(self._process_task_background, task_id)
+            backend = "webfetch" if _is_url((content or "").strip()) else "search"
+            self._submit_coro(self._process_task_background(task_id, backend))
 
-        preview = content[:30]
-        suffix = "..." if len(content) > 30 else ""
-        return f"📥 Logged: \"{preview}{suffix}\""
+        return f"📥 Logged: \"{_trunc(content, 30)}\""
 
     def get_session_summary(self, session_id: Optional[str] = None) -> str:
         """
@@ -96,40 +198,27 @@ class ParkingService:
         if not target_session:
             return "📭 No parked thoughts during this focus session."
 
-        tasks = self._load_tasks()
+        # Several services can share the store with overlapping sessions, so
+        # their tasks interleave; filter the whole list rather than stopping early.
         session_tasks = [
-            t
-            for t in tasks
-            if t.get("session_id") == target_session or target_session is None
+            task for task in self._load_tasks() if task.get("session_id") == target_session
         ]
 
         if not session_tasks:
             return "📭 No parked thoughts during this focus session."
 
-        lines = ["📋 **Focus session thought summary:**", ""]
-        for task in session_tasks:
-            status = task.get("status", TaskStatus.PENDING.value)
-            content = task.get("content", "")[:50]
-            result = task.get("result")
-
-            if status == TaskStatus.COMPLETED.value and result:
-                tail = "..." if len(result) > 200 else ""
-                lines.append(f"✅ \"{content}\"")
-                lines.append(f"   → {result[:200]}{tail}")
-            elif status == TaskStatus.PENDING.value:
-                lines.append(f"⏳ \"{content}\" - still processing")
-            elif status == TaskStatus.FAILED.value:
-                lines.append(f"❌ \"{content}\" - failed")
-            else:
-                lines.append(f"📝 \"{content}\" - logged")
-            lines.append("")
-
-        return "\n".join(lines).rstrip()
+        blocks = "\n\n".join(
+            _SUMMARY_TEMPLATES.get(
+                task.get("status", _PENDING), _summarize_logged
+            )(task.get("content", "")[:50], task)
+            for task in session_tasks
+        )
+        return f"📋 **Focus session thought summary:**\n\n{blocks}".rstrip()
 
     def list_pending_tasks(self) -> str:
         """List all pending tasks for quick inspection."""
         tasks = self._load_tasks()
-        pending = [t for t in tasks if t.get("status") == TaskStatus.PENDING.value]
+        pending = [t for t in tasks if t.get("status") == _PENDING]
 
         if not pending:
             return "📭 No pending parked thoughts right now."
@@ -137,12 +226,12 @@ class ParkingService:
         lines = [f"📋 Pending thoughts ({len(pending)}):"]
         for task in pending:
             content = task.get("content", "")[:40]
-            lines.append(f"  - {content} [{task.get('type', TaskType.MEMO.value)}]")
+            lines.append(f"  - {content} [{task.get('type', _MEMO)}]")
         return "\n".join(lines)
 
     def start_session(self) -> str:
         """Mark the beginning of a focus session."""
-        self._session_id = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._session_id = time.strftime("%Y%m%d_%H%M%S")
         return self._session_id
 
     def end_session(self) -> str:
@@ -160,102 +249,215 @@ class ParkingService:
             if not os.path.exists(self._current_file):
                 return []
             try:
-                with open(self._current_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self._current_file, "rb") as f:
+                    raw = f.read()
+                data = loads_json(raw)
                 return data if isinstance(data, list) else []
             except Exception:
                 return []
 
     def _save_tasks(self, tasks: List[Dict[str, Any]]):
+        # Copy-on-write: readers see either the old or the new file, never a
+        # partially written one.
         with self._lock:
-            with open(self._current_file, "w", encoding="utf-8") as f:
-                json.dump(tasks, f, ensure_ascii=False, indent=2)
+            write_json_atomic(self._current_file, tasks)
 
-    def _append_task(self, task: Dict[str, Any]):
+    @contextlib.contextmanager
+    def _store_transaction(self) -> Iterator[None]:
+        """Serialize load → mutate → save across threads and processes."""
         with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self._store_lock_file, "a") as lock_fh:
+                fcntl.flock(lock_fh, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_fh, fcntl.LOCK_UN)
+
+    def _append_task(self, task: Dict[str, Any]):
+        with self._store_transaction():
             tasks = self._load_tasks()
             tasks.append(task)
             self._save_tasks(tasks)
 
-    def _update_task(self, task_id: str, updates: Dict[str, Any]):
-        with self._lock:
+    def _update_task(
+        self, task_id: str, updates: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Apply updates to a stored task and return it (None if not found)."""
+        with self._store_transaction():
             tasks = self._load_tasks()
+            found: Optional[Dict[str, Any]] = None
             for task in tasks:
                 if task.get("id") == task_id:
                     task.update(updates)
+                    found = task
                     break
             self._save_tasks(tasks)
+            return found
 
     def _log_to_daily(self, message: str):
-        # Logging to a text file is append-only, less critical to lock but good practice.
-        # However, Python's file append is atomic on POSIX for small writes.
-        # We'll lock to be consistent.
+        self._log_batch([message])
+
+    def _log_batch(self, lines: List[str]):
+        """Write several log lines with a single write, flushed immediately."""
+        if not lines:
+            return
+        # Reuse one handle per day instead of open/write/close per line, but
+        # flush every record so readers (guardian_agent) never see stale data.
+        with self._lock:
+            today = time.strftime("%Y-%m-%d")
+            if self._log_fh is None or self._log_date != today:
+                self._close_logs()
+                log_path = os.path.join(self.parking_dir, f"thought_parking_{today}.txt")
+                self._log_fh = open(log_path, "a", encoding="utf-8")
+                self._log_date = today
+            self._log_fh.write("\n".join(lines) + "\n")
+            self._log_fh.flush()
+
+    def _close_logs(self):
+        """Flush and close the cached daily log handle (also runs at exit)."""
         with self._lock:
-            today = datetime.date.today().isoformat()
-            log_path = os.path.join(self.parking_dir, f"thought_parking_{today}.txt")
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(message + "\n")
+            if self._log_fh is not None:
+                try:
+                    self._log_fh.close()
+                except Exception:
+                    pass
+            self._log_fh = None
+            self._log_date = None
 
     def _format_result_for_log(self, result: Optional[str]) -> List[str]:
         """Normalize a potentially multi-line result into concise log lines."""
         if result is None:
             return ["(no result)"]
-        lines: List[str] = []
-        for raw in str(result).splitlines():
-            line = raw.strip()
-            if not line:
-                continue
-            lines.append(line)
-            if len(lines) >= 20:
-                break
+        # Stop after 20 non-empty lines instead of splitting the whole result.
+        lines = [
+            match.group().strip()
+            for match in itertools.islice(_LOG_LINE_RE.finditer(str(result)), 20)
+        ]
         return lines or ["(no result)"]
 
-    def _process_task_background(self, task_id: str):
-        """Execute background work for search tasks without blocking user flow."""
-        self._update_task(task_id, {"status": TaskStatus.PROCESSING.value})
+    def _submit_coro(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """Schedule a coroutine on the background loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
-        tasks = self._load_tasks()
-        task = next((t for t in tasks if t.get("id") == task_id), None)
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking store/log call on the store worker, off the loop thread."""
+        return await self._loop.run_in_executor(self._executors["store"], func, *args)
+
+    async def _cancel_pending(self):
+        """Cancel every other task on the loop and wait for them to unwind."""
+        pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def close(self):
+        """Stop the background loop and worker pools, then close the daily log."""
+        if self._loop.is_closed():
+            return
+        self._submit_coro(self._cancel_pending()).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        for executor in self._executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._loop.close()
+        self._close_logs()
+        atexit.unregister(self._close_logs)
+
+    async def _process_task_background(self, task_id: str, backend: str = "search"):
+        """Execute background work for search tasks without blocking user flow."""
+        task = await self._run_blocking(
+            self._update_task, task_id, {"status": _PROCESSING}
+        )
         if not task:
             return
 
         content = task.get("content", "")
+        query_text = content.strip()
+
+        # Coalesce identical in-flight queries onto one search. Keyword searches
+        # ignore case; URL paths are case-sensitive, so URLs match exactly.
+        key = query_text if _is_url(query_text) else query_text.lower()
+        search = self._search_futures.get(key)
+        if search is None:
+            search = self._loop.run_in_executor(
+                self._executors[backend], self._perform_search, query_text
+            )
+            self._search_futures[key] = search
+            search.add_done_callback(lambda _: self._search_futures.pop(key, None))
 
         try:
-            result = self._perform_search(content)
-            self._update_task(
+            result = await asyncio.shield(search)
+            now = time.localtime()
+            await self._run_blocking(
+                self._update_task,
                 task_id,
                 {
-                    "status": TaskStatus.COMPLETED.value,
+                    "status": _COMPLETED,
                     "result": result,
-                    "completed_at": datetime.datetime.now().strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    ),
+                    "completed_at": time.strftime(_TIMESTAMP_FORMAT, now),
                 },
             )
-            self._log_to_daily(
-                f"[{datetime.datetime.now().strftime('%H:%M:%S')}] ✅ Completed: {content[:30]}"
+            await self._run_blocking(
+                self._log_batch,
+                [
+                    f"[{time.strftime(_CLOCK_FORMAT, now)}] ✅ Completed: {content[:30]}",
+                    *(f"   → {line}" for line in self._format_result_for_log(result)),
+                ],
             )
-            for line in self._format_result_for_log(result):
-                self._log_to_daily(f"   → {line}")
         except Exception as exc:  # pragma: no cover - defensive fallback
-            self._update_task(
-                task_id, {"status": TaskStatus.FAILED.value, "error": str(exc)}
+            await self._run_blocking(
+                self._update_task, task_id, {"status": _FAILED, "error": str(exc)}
             )
-            self._log_to_daily(
-                f"[{datetime.datetime.now().strftime('%H:%M:%S')}] ❌ Failed: {content[:30]}"
+            await self._run_blocking(
+                self._log_batch,
+                [
+                    f"[{time.strftime(_CLOCK_FORMAT)}] ❌ Failed: {content[:30]}",
+                    f"   → Error: {exc}",
+                ],
             )
-            self._log_to_daily(f"   → Error: {exc}")
 
-    def _internet_search(self, query: str) -> str:
-        """Search DuckDuckGo and return a formatted summary."""
-        query_text = (query or "").strip()
+    def _internet_search(self, query_text: str) -> str:
+        """Search DuckDuckGo for an already-stripped query and format a summary."""
         if not query_text:
             return "No query provided."
 
+        max_results = 3
+        lines: List[str] = [_SEARCH_HEADER, ""]
+        count = 0
         try:
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query_text, max_results=3))
+            with _get_ddgs()() as ddgs:
+                # Format each hit as it arrives instead of materializing a list.
+                for item in ddgs.text(query_text, max_results=max_results):
+                    count += 1
+                    title = (item.get("title") or "Untitled").strip()
+                    url = (
+                        item.get("href")
+                        or item.get("url")
+                        or item.get("link")
+                        or item.get("source")
+                        or ""
+                    )
+                    snippet = (
+                        item.get("body")
+                        or item.get("snippet")
+                        or item.get("description")
+                        or ""
+                    )
+                    snippet = _WS_RE.sub(" ", str(snippet)).strip()
+                    if len(snippet) > 100:
+                        snippet = snippet[:100].rstrip() + "..."
+
+                    lines.append(f"{count}. {title}")
+                    if snippet:
+                        lines.append(f"   {snippet}")
+                    if url:
+                        lines.append(f"   Source: {url}")
+                    lines.append("")
+                    if count >= max_results:
+                        break
         except Exception as exc:
             message = str(exc)
             lowered = message.lower()
@@ -265,34 +467,10 @@ class ParkingService:
                 return "Search service temporarily unavailable."
             return f"Search failed: {message}"
 
-        if not results:
+        if not count:
             return "No results found. Try different keywords."
 
-        lines: List[str] = ["🔍 Search results:", ""]
-        for idx, item in enumerate(results, start=1):
-            title = (item.get("title") or "Untitled").strip()
-            url = (
-                item.get("href")
-                or item.get("url")
-                or item.get("link")
-                or item.get("source")
-                or ""
-            )
-            snippet = (
-                item.get("body") or item.get("snippet") or item.get("description") or ""
-            )
-            snippet = " ".join(str(snippet).split())
-            if len(snippet) > 100:
-                snippet = snippet[:100].rstrip() + "..."
-
-            lines.append(f"{idx}. {title}")
-            if snippet:
-                lines.append(f"   {snippet}")
-            if url:
-                lines.append(f"   Source: {url}")
-            lines.append("")
-
-        lines.append(f"({len(results)} results; full details in current_parking.json)")
+        lines.append(f"({count} results; full details in current_parking.json)")
         return "\n".join(lines).rstrip()
 
     def _fetch_with_webfetch(self, url: str) -> str:
@@ -328,14 +506,71 @@ class ParkingService:
         except Exception as exc:
             return f"[Failed] Web fetch error: {exc}"
 
-    def _perform_search(self, query: str) -> str:
+    def _perform_search(self, query_text: str) -> str:
         """
         Search-first flow: keyword uses DuckDuckGo, URL keeps WebFetch summary.
+        Expects the query already stripped by _process_task_background.
         """
-        query_text = (query or "").strip()
-        if query_text.lower().startswith(("http://", "https://")):
+        if _is_url(query_text):
             return self._fetch_with_webfetch(query_text)
-        return self._internet_search(query_text)
+
+        cache_path = self._search_cache_path(query_text)
+        cached = self._read_search_cache(cache_path)
+        if cached is not None:
+            return cached
+        result = self._internet_search(query_text)
+        # Errors come back as plain messages; only cache real result lists.
+        if result.startswith(_SEARCH_HEADER):
+            self._write_search_cache(cache_path, query_text, result)
+        return result
+
+    def _search_cache_path(self, query_text: str) -> str:
+        digest = hashlib.sha256(query_text.lower().encode("utf-8")).hexdigest()
+        return os.path.join(self._search_cache_dir, f"{digest}.json")
+
+    def _read_search_cache(self, path: str) -> Optional[str]:
+        """Return a cached search result if it exists and is still fresh."""
+        try:
+            if os.path.getmtime(path) < time.time() - _SEARCH_CACHE_TTL:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        result = data.get("result") if isinstance(data, dict) else None
+        return result if isinstance(result, str) else None
+
+    def _write_search_cache(self, path: str, query_text: str, result: str):
+        """Persist a search result atomically; cache failures are non-fatal."""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self._search_cache_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"query": query_text, "result": result}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._prune_search_cache()
+
+    def _prune_search_cache(self):
+        """Drop cache entries past the TTL so the directory cannot grow forever."""
+        cutoff = time.time() - _SEARCH_CACHE_TTL
+        try:
+            with os.scandir(self._search_cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.remove(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
 
 
 class ParkingToolkit:
@@ -345,13 +580,13 @@ class ParkingToolkit:
         self.service = service or ParkingService()
 
     def park_thought(
-        self, content: str, thought_type: str = TaskType.SEARCH.value
+        self, content: str, thought_type: str = _SEARCH
     ) -> str:
         """
         Stash a thought or query for background processing.
         thought_type: search | memo | todo
         """
-        normalized_type = (thought_type or TaskType.SEARCH.value).lower()
+        normalized_type = (thought_type or _SEARCH).lower()
         return self.service.dispatch_task(
             content=content,
             task_type=normalized_type,
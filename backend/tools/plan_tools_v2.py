@@ -1,21 +1,62 @@
+import atexit
+import bisect
 import datetime
+import functools
+import inspect
+import itertools
 import json
 import os
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Union
 
+from core.jsonio import loads_json, write_json_atomic
 from core.paths import resolve_data_root
+from core.workers import worker_count
+
+# Debug logger: write straight to <data root>/FORCE_DEBUG.txt to avoid console noise.
+# The handle stays open (line-buffered) and is reopened only if the data root moves.
+_LOG_LOCK = threading.Lock()
+_LOG_FH: Optional[TextIO] = None
+_LOG_PATH: Optional[str] = None
+_LOG_STAMP: Tuple[int, str] = (-1, "")
+
+
+def _close_debug_log() -> None:
+    global _LOG_FH, _LOG_PATH
+    with _LOG_LOCK:
+        if _LOG_FH is not None:
+            try:
+                _LOG_FH.close()
+            except Exception:
+                pass
+        _LOG_FH = None
+        _LOG_PATH = None
+
+
+atexit.register(_close_debug_log)
+
 
-# Debug logger: write straight to file to avoid console noise.
 def debug_log(message):
+    global _LOG_FH, _LOG_PATH, _LOG_STAMP
     try:
-        data_root = resolve_data_root()
-        os.makedirs(data_root, exist_ok=True)
-        log_path = os.path.join(data_root, "FORCE_DEBUG.txt")
-
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
+        log_path = os.path.join(resolve_data_root(), "FORCE_DEBUG.txt")
+        second = int(time.time())
+        with _LOG_LOCK:
+            # HH:MM:SS only changes once a second; reuse the formatted stamp.
+            if _LOG_STAMP[0] != second:
+                _LOG_STAMP = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+            if _LOG_FH is None or _LOG_PATH != log_path:
+                if _LOG_FH is not None:
+                    _LOG_FH.close()
+                    _LOG_FH = None
+                os.makedirs(os.path.dirname(log_path), exist_ok=True)
+                _LOG_FH = open(log_path, "a", encoding="utf-8", buffering=1)
+                _LOG_PATH = log_path
+            _LOG_FH.write(f"[{_LOG_STAMP[1]}] {message}\n")
     except Exception:
         pass  # never raise
 
@@ -24,6 +65,195 @@ def debug_log(message):
 debug_log(">>> plan_tools_v2 module loaded <<<")
 
 
+_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_EVENT_ID_RE = re.compile(r"Event ID:\s*(\S+)")
+_EVENT_DEL_RE = re.compile(r"Event deleted:\s*(\S+)")
+
+@functools.lru_cache(maxsize=1024)
+def _extract_date_cached(text: str) -> Optional[datetime.date]:
+    """Date part of a stripped datetime string, if any (cached per string)."""
+    try:
+        dt = datetime.datetime.fromisoformat(text.replace("T", " "))
+        return dt.date()
+    except Exception:
+        pass
+    # Clock-only values ("09:00") cannot carry a date; skip the regex.
+    if "-" not in text:
+        return None
+    match = _DATE_RE.search(text)
+    if match:
+        try:
+            return datetime.datetime.strptime(match.group(1), "%Y-%m-%d").date()
+        except ValueError:
+            return None
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _calendar_time_cached(text: str) -> str:
+    """ISO-like calendar form of a stripped plan time (cached per string)."""
+    if "T" not in text and " " in text:
+        text = text.replace(" ", "T")
+    if "T" not in text:
+        return text
+    # Ensure seconds are present to satisfy GoogleCalendar parser
+    if len(text.split("T", 1)[1]) == 5:
+        text = f"{text}:00"
+    return text
+
+
+_CALENDAR_POOL_LOCK = threading.Lock()
+_CALENDAR_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _calendar_executor() -> Optional[ThreadPoolExecutor]:
+    """Shared pool for calendar calls, or None when sync stays sequential (default)."""
+    global _CALENDAR_POOL
+    if _CALENDAR_POOL is None:
+        workers = worker_count("ADHD_CALENDAR_SYNC_WORKERS")
+        if workers == 1:
+            return None
+        with _CALENDAR_POOL_LOCK:
+            if _CALENDAR_POOL is None:
+                _CALENDAR_POOL = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="calendar-sync"
+                )
+    return _CALENDAR_POOL
+
+
+# Calendar update retries: transient errors back off 0.25s, 0.5s before giving up.
+_UPDATE_TRIES = 3
+_UPDATE_BACKOFF = 0.25
+_TRANSIENT_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _error_status(exc: Exception) -> Optional[int]:
+    """HTTP status carried by a client exception (googleapiclient, httpx, requests)."""
+    for holder in (exc, getattr(exc, "resp", None), getattr(exc, "response", None)):
+        status = getattr(holder, "status_code", None) or getattr(holder, "status", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def _is_transient_error(exc: Exception) -> bool:
+    return (
+        isinstance(exc, (TimeoutError, ConnectionError))
+        or _error_status(exc) in _TRANSIENT_STATUS
+    )
+
+
+def _is_not_found_error(exc: Exception) -> bool:
+    status = _error_status(exc)
+    if status is not None:
+        return status in (404, 410)
+    text = str(exc).lower()
+    return "not found" in text or "404" in text or "deleted" in text
+
+
+def _calendar_time_kwargs(method) -> Optional[Tuple[str, str]]:
+    """Keyword names a calendar method takes for start/end, or None if it can't be told."""
+    try:
+        params = inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return None
+    if "start_time" in params and "end_time" in params:
+        return ("start_time", "end_time")
+    if "start" in params and "end" in params:
+        return ("start", "end")
+    return None
+
+
+def _calendar_update_style(update_event) -> Optional[Tuple[bool, str, str]]:
+    """(event_id passed by keyword, start key, end key) for update_event, or None."""
+    time_kwargs = _calendar_time_kwargs(update_event)
+    if not time_kwargs:
+        return None
+    params = inspect.signature(update_event).parameters
+    return ("event_id" in params, *time_kwargs)
+
+
+# Only strings with a date part can match the full formats; the rest are clock times.
+_DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M")
+_TIME_FORMATS = ("%H:%M:%S", "%H:%M")
+# Prepared calendar call: (action, event_id, title, iso_start, iso_end).
+CalendarRequest = Tuple[str, Optional[str], str, Optional[str], Optional[str]]
+
+# Field defaults filled into every merged task in one update.
+_TASK_DEFAULTS = {
+    "type": "work",
+    "status": "pending",
+    "sync_status": "pending",
+    "google_event_id": None,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_dt_cached(
+    value: str, plan_date: datetime.date, tzinfo: Optional[datetime.tzinfo]
+) -> Optional[datetime.datetime]:
+    """Parse a stripped time string; results are cached per (value, date, tz)."""
+    try:
+        dt = datetime.datetime.fromisoformat(value.replace("T", " "))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=tzinfo)
+        return dt.astimezone(tzinfo)
+    except Exception:
+        pass
+
+    if "-" in value:
+        for fmt in _DATETIME_FORMATS:
+            try:
+                dt = datetime.datetime.strptime(value, fmt)
+                return dt.replace(tzinfo=tzinfo)
+            except ValueError:
+                continue
+        return None
+
+    for fmt in _TIME_FORMATS:
+        try:
+            t = datetime.datetime.strptime(value, fmt).time()
+            return datetime.datetime.combine(plan_date, t).replace(tzinfo=tzinfo)
+        except ValueError:
+            continue
+
+    return None
+
+
+def _format_hhmm(dt: datetime.datetime) -> str:
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+def _plan_time_text(raw: Any, dt: datetime.datetime) -> str:
+    """Stored 'YYYY-MM-DD HH:MM' text for dt; raw is reused when already in that form."""
+    if isinstance(raw, str):
+        text = raw.strip()
+        if len(text) == 16 and text[10] == " " and text[13] == ":":
+            return text
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {_format_hhmm(dt)}"
+
+
+def _task_key(task: Dict) -> Any:
+    """Merge key for plan tasks: id, falling back to title."""
+    return task.get("id") or task.get("title")
+
+
+def _start_key(task: Dict) -> str:
+    return task.get("start") or ""
+
+
+def _replace_sorted(tasks: List[Dict], old: Dict, new: Dict) -> None:
+    """Swap old for new in a start-sorted list, moving it only if start changed."""
+    idx = bisect.bisect_left(tasks, _start_key(old), key=_start_key)
+    while tasks[idx] is not old:
+        idx += 1
+    if _start_key(old) == _start_key(new):
+        tasks[idx] = new
+        return
+    del tasks[idx]
+    bisect.insort_right(tasks, new, key=_start_key)
+
+
 class PlanManager:
     """
     Manage daily_tasks_YYYY-MM-DD.json read/write and conflict detection.
@@ -36,6 +266,33 @@ class PlanManager:
         self.calendar = calendar
         self.last_sync_time: Optional[datetime.datetime] = None
         self.last_sync_summary: Optional[Dict[str, int]] = None
+        self._refresh_local_tz()
+
+    @property
+    def calendar(self):
+        return self._calendar
+
+    @calendar.setter
+    def calendar(self, value) -> None:
+        # Resolve capability checks once per assignment instead of per synced task.
+        self._calendar = value
+        self._calendar_enabled = bool(value) and not isinstance(value, str)
+        self._calendar_is_fallback = hasattr(value, "reason")
+        self._calendar_has_create = hasattr(value, "create_event")
+        self._calendar_has_update = hasattr(value, "update_event")
+        self._calendar_has_delete = hasattr(value, "delete_event")
+        # event_id -> (title, iso_start, iso_end) last written to this calendar.
+        self._last_sync: Dict[str, Tuple[str, Optional[str], Optional[str]]] = {}
+        self._calendar_time_kwargs = (
+            _calendar_time_kwargs(value.create_event)
+            if self._calendar_has_create
+            else None
+        )
+        self._calendar_update_style = (
+            _calendar_update_style(value.update_event)
+            if self._calendar_has_update
+            else None
+        )
 
     # -- Public methods --
 
@@ -44,7 +301,7 @@ class PlanManager:
         Return current date/time/timezone and today's plan summary (if any).
         Ensures the agent does not schedule into the past.
         """
-        now = datetime.datetime.now().astimezone()
+        now = self._refresh_local_tz()
         now_text = now.strftime("%Y-%m-%d %H:%M %Z (UTC%z)")
         today = now.date()
         plan_date, date_err = self._parse_plan_date(target_date, today)
@@ -65,20 +322,12 @@ class PlanManager:
             )
 
         summary_lines = []
-        plan_date = self._plan_date_from_path(path)
-        normalized = self._normalize_for_summary(tasks, plan_date)
-        for idx, task in enumerate(normalized, start=1):
-            start_text = (
-                task["start_dt"].strftime("%H:%M")
-                if task["start_dt"]
-                else (task["raw_start"] or "-")
-            )
-            end_text = (
-                task["end_dt"].strftime("%H:%M")
-                if task["end_dt"]
-                else (task["raw_end"] or "-")
-            )
-            duration = self._format_duration(task["start_dt"], task["end_dt"])
+        for idx, (start_dt, end_dt, task) in enumerate(
+            self._iter_sorted_tasks(tasks, plan_date), start=1
+        ):
+            start_text = _format_hhmm(start_dt) if start_dt else (task.get("start") or "-")
+            end_text = _format_hhmm(end_dt) if end_dt else (task.get("end") or "-")
+            duration = self._format_duration(start_dt, end_dt)
             duration_mark = f" ({duration} min)" if duration else ""
             title = task.get("title") or f"Task {idx}"
             status = task.get("status", "pending")
@@ -102,21 +351,31 @@ class PlanManager:
         debug_log(f"Raw data preview: {str(tasks)[:100]}...")
 
         # --- 1. Parse and validate params ---
+        tasks, parse_err = self._parse_tasks_param(tasks)
+        if parse_err:
+            return f"❌ Plan creation failed: {parse_err}"
+        return self._merge_daily_plan(tasks, target_date)
+
+    def _parse_tasks_param(
+        self, tasks: Union[List[Dict], str]
+    ) -> Tuple[Optional[List], Optional[str]]:
+        """Decode a tasks argument (list or JSON string); returns (tasks, error)."""
         original_tasks = tasks
         if isinstance(tasks, str):
             try:
-                tasks = json.loads(tasks)
+                tasks = loads_json(tasks)
             except json.JSONDecodeError as exc:
-                err_msg = f"JSON parse error: {exc}"
-                debug_log(err_msg)
-                return f"❌ Plan creation failed: tasks JSON parse error: {exc}"
+                debug_log(f"JSON parse error: {exc}")
+                return None, f"tasks JSON parse error: {exc}"
 
         if not isinstance(tasks, list):
-            err_msg = f"Type error: expected list, got {type(original_tasks).__name__}"
-            debug_log(err_msg)
-            return "❌ Plan creation failed: tasks must be a list."
+            debug_log(f"Type error: expected list, got {type(original_tasks).__name__}")
+            return None, "tasks must be a list."
+        return tasks, None
 
-        now = datetime.datetime.now().astimezone()
+    def _merge_daily_plan(self, tasks: List, target_date: Optional[str]) -> str:
+        """Merge decoded tasks into the date's plan with one load and one write."""
+        now = self._refresh_local_tz()
         plan_date, date_err = self._determine_plan_date(
             target_date=target_date, tasks=tasks, today=now.date()
         )
@@ -157,8 +416,8 @@ class PlanManager:
                 normalized_task["id"] = f"task_{int(now.timestamp())}_{idx}"
 
             normalized_task["title"] = title
-            normalized_task["start"] = start_dt.strftime("%Y-%m-%d %H:%M")
-            normalized_task["end"] = end_dt.strftime("%Y-%m-%d %H:%M")
+            normalized_task["start"] = _plan_time_text(task.get("start"), start_dt)
+            normalized_task["end"] = _plan_time_text(task.get("end"), end_dt)
             normalized_task.setdefault("type", "work")
             # Default to pending unless provided
             normalized_task.setdefault("status", "pending")
@@ -174,41 +433,107 @@ class PlanManager:
         existing_tasks, path, _ = self._load_tasks(
             plan_date_str, create_if_missing=True
         )
+        # Shallow snapshot: merging builds new dicts, so the loaded ones stay
+        # untouched and can be compared against the result to skip no-op writes.
+        loaded_tasks = list(existing_tasks) if existing_tasks is not None else None
         if existing_tasks is None:
             existing_tasks = []
 
         # Merge using title or id as the key; update existing with new.
         task_map = {}
         for t in existing_tasks:
-            key = t.get("id") or t.get("title")
-            task_map[key] = t
+            task_map[_task_key(t)] = t
+
+        # Plans are written sorted, so keep the list ordered incrementally
+        # instead of re-sorting; only dedupe/sort if the file was edited elsewhere.
+        final_tasks = (
+            existing_tasks
+            if len(task_map) == len(existing_tasks)
+            else list(task_map.values())
+        )
+        if any(
+            _start_key(a) > _start_key(b) for a, b in itertools.pairwise(final_tasks)
+        ):
+            final_tasks.sort(key=_start_key)
+
+        added_count, updated_count, sync_items = self._merge_into(
+            task_map, final_tasks, normalized_new_tasks
+        )
 
+        sync_success = 0
+        sync_failed = 0
+        sync_pending = 0
+        sync_errors: List[str] = []
+        if sync_items:
+            sync_success, sync_failed, sync_pending, sync_errors = (
+                self._sync_calendar_batch(sync_items)
+            )
+
+        # --- 4. Write file (skipped when the merge changed nothing) ---
+        unchanged = final_tasks == loaded_tasks and os.path.exists(path)
+        if unchanged:
+            debug_log(f"No changes; skip writing {path}")
+        else:
+            debug_log(f"Writing file: {path}, tasks: {len(final_tasks)}")
+            write_err = self._write_tasks(path, final_tasks)
+            if write_err:
+                debug_log(f"❌ Fatal: write failed - {write_err}")
+                return f"❌ Write failed: {write_err}"
+
+        # --- 5. Calendar sync feedback ---
+        sync_msg = ""
+        if sync_success:
+            sync_msg = f" (synced {sync_success} to calendar)"
+        if sync_failed:
+            sync_msg = f"{sync_msg} (failed {sync_failed} syncs; see logs)"
+        elif sync_pending:
+            sync_msg = f"{sync_msg} (pending {sync_pending} syncs)"
+
+        action_msg = []
+        if added_count:
+            action_msg.append(f"added {added_count}")
+        if updated_count:
+            action_msg.append(f"updated {updated_count}")
+
+        if unchanged:
+            return (
+                f"✅ Plan already up to date (date: {plan_date_str}); no changes written. "
+                f"Total tasks: {len(final_tasks)}.{sync_msg}"
+            )
+
+        result_msg = (
+            f"✅ Plan updated (date: {plan_date_str}). "
+            f"{', '.join(action_msg)}. Total tasks: {len(final_tasks)}.{sync_msg}"
+        )
+        return result_msg
+
+    def _merge_into(
+        self, task_map: Dict[str, Dict], final_tasks: List[Dict], new_tasks: List[Dict]
+    ) -> Tuple[int, int, List[Tuple[Dict, str]]]:
+        """
+        Upsert normalized tasks into task_map and the start-sorted final_tasks.
+        Returns (added, updated, calendar sync items).
+        """
         added_count = 0
         updated_count = 0
         sync_items: List[Tuple[Dict, str]] = []
 
-        for new_t in normalized_new_tasks:
-            key = new_t.get("id") or new_t.get("title")
+        for new_t in new_tasks:
+            key = _task_key(new_t)
             if not key:
                 continue
 
             old_task = task_map.get(key)
+            # Incoming fields win over the stored task (e.g. status); defaults only
+            # fill what both lack, appended so the file's key order is unchanged.
             merged_task = {**(old_task or {}), **new_t}
-
-            # Preserve old status unless explicitly provided
-            if old_task and "status" not in new_t:
-                merged_task["status"] = old_task.get("status", "pending")
-            merged_task.setdefault("status", "pending")
-
-            # Preserve old sync status unless explicitly provided
-            if old_task and "sync_status" not in new_t:
-                merged_task["sync_status"] = old_task.get("sync_status", "pending")
-            merged_task.setdefault("sync_status", "pending")
+            merged_task.update(
+                {k: v for k, v in _TASK_DEFAULTS.items() if k not in merged_task}
+            )
 
             # Preserve calendar event id
-            merged_task["google_event_id"] = merged_task.get("google_event_id") or (
-                old_task.get("google_event_id") if old_task else None
-            )
+            if old_task and not merged_task["google_event_id"]:
+                merged_task["google_event_id"] = old_task.get("google_event_id")
 
             action = "update" if old_task else "create"
             # Skip calendar sync if unchanged and already has an event id
@@ -225,60 +550,18 @@ class PlanManager:
             if needs_sync:
                 sync_items.append((merged_task, action))
             else:
-                if merged_task.get("google_event_id"):
-                    merged_task["sync_status"] = (
-                        merged_task.get("sync_status") or "success"
-                    )
-                else:
-                    merged_task["sync_status"] = (
-                        merged_task.get("sync_status") or "pending"
-                    )
+                # Unchanged tasks always carry an event id here.
+                merged_task["sync_status"] = merged_task["sync_status"] or "success"
 
             task_map[key] = merged_task
             if old_task:
+                _replace_sorted(final_tasks, old_task, merged_task)
                 updated_count += 1
             else:
+                bisect.insort_right(final_tasks, merged_task, key=_start_key)
                 added_count += 1
 
-        final_tasks = list(task_map.values())
-        final_tasks.sort(key=lambda t: t.get("start", ""))
-
-        sync_success = 0
-        sync_failed = 0
-        sync_pending = 0
-        sync_errors: List[str] = []
-        if sync_items:
-            sync_success, sync_failed, sync_pending, sync_errors = (
-                self._sync_calendar_batch(sync_items)
-            )
-
-        # --- 4. Write file ---
-        debug_log(f"Writing file: {path}, tasks: {len(final_tasks)}")
-        write_err = self._write_tasks(path, final_tasks)
-        if write_err:
-            debug_log(f"❌ Fatal: write failed - {write_err}")
-            return f"❌ Write failed: {write_err}"
-
-        # --- 5. Calendar sync feedback ---
-        sync_msg = ""
-        if sync_success:
-            sync_msg = f" (synced {sync_success} to calendar)"
-        if sync_failed:
-            sync_msg = f"{sync_msg} (failed {sync_failed} syncs; see logs)"
-        elif sync_pending:
-            sync_msg = f"{sync_msg} (pending {sync_pending} syncs)"
-
-        action_msg = []
-        if added_count:
-            action_msg.append(f"added {added_count}")
-        if updated_count:
-            action_msg.append(f"updated {updated_count}")
-
-        result_msg = (
-            f"✅ Plan updated (date: {plan_date_str}). "
-            f"{', '.join(action_msg)}. Total tasks: {len(final_tasks)}.{sync_msg}"
-        )
-        return result_msg
+        return added_count, updated_count, sync_items
 
     def update_schedule(
         self,
@@ -296,6 +579,7 @@ class PlanManager:
         - target_date selects which day (default today).
         - Numeric task_id is treated as a 1-based index.
         """
+        self._refresh_local_tz()
         today = datetime.date.today()
         plan_date, date_err = self._determine_plan_date_for_update(
             new_start=new_start, new_end=new_end, target_date=target_date, today=today
@@ -310,7 +594,6 @@ class PlanManager:
         if tasks is None:
             return f"❌ Update failed: invalid plan format: {path}"
 
-        plan_date = self._plan_date_from_path(path)
         start_dt = self._normalize_to_dt(new_start, plan_date)
         end_dt = self._normalize_to_dt(new_end, plan_date)
         if not start_dt or not end_dt:
@@ -339,8 +622,8 @@ class PlanManager:
                 self._sync_calendar(c, "delete")
                 tasks.remove(c)
 
-        start_text = start_dt.strftime("%Y-%m-%d %H:%M")
-        end_text = end_dt.strftime("%Y-%m-%d %H:%M")
+        start_text = _plan_time_text(new_start, start_dt)
+        end_text = _plan_time_text(new_end, end_dt)
         created = False
 
         if target_task:
@@ -401,6 +684,7 @@ class PlanManager:
 
     def list_tasks(self, target_date: Optional[str] = None) -> str:
         """List tasks for a given date (default today)."""
+        self._refresh_local_tz()
         today = datetime.date.today()
         plan_date, date_err = self._parse_plan_date(target_date, today)
         if date_err:
@@ -414,21 +698,13 @@ class PlanManager:
             prefix = "No plan for today" if plan_date == today else "No plan"
             return f"{prefix}: {self._plan_path(plan_date_str)}"
 
-        plan_date = self._plan_date_from_path(path)
-        normalized = self._normalize_for_summary(tasks, plan_date)
         lines = [f"Plan file: {path}"]
-        for idx, task in enumerate(normalized, start=1):
-            start_text = (
-                task["start_dt"].strftime("%H:%M")
-                if task["start_dt"]
-                else (task["raw_start"] or "-")
-            )
-            end_text = (
-                task["end_dt"].strftime("%H:%M")
-                if task["end_dt"]
-                else (task["raw_end"] or "-")
-            )
-            duration = self._format_duration(task["start_dt"], task["end_dt"])
+        for idx, (start_dt, end_dt, task) in enumerate(
+            self._iter_sorted_tasks(tasks, plan_date), start=1
+        ):
+            start_text = _format_hhmm(start_dt) if start_dt else (task.get("start") or "-")
+            end_text = _format_hhmm(end_dt) if end_dt else (task.get("end") or "-")
+            duration = self._format_duration(start_dt, end_dt)
             duration_mark = f" ({duration} min)" if duration else ""
             title = task.get("title") or f"Task {idx}"
             status = task.get("status", "pending")
@@ -478,6 +754,8 @@ class PlanManager:
 
         success = failed = pending = 0
         errors: List[str] = []
+        # A forced sync re-sends everything, even events this process already wrote.
+        self._last_sync.clear()
         if sync_items:
             success, failed, pending, errors = self._sync_calendar_batch(sync_items)
         else:
@@ -510,6 +788,13 @@ class PlanManager:
 
     # -- Internal helpers --
 
+    def _refresh_local_tz(self) -> datetime.datetime:
+        """Cache the local tzinfo (re-read per public call to follow DST); return now."""
+        now = datetime.datetime.now().astimezone()
+        self._local_tz = now.tzinfo
+        self._tz_max = datetime.datetime.max.replace(tzinfo=self._local_tz)
+        return now
+
     def _plan_path(self, date_str: str) -> str:
         return os.path.join(self.plan_dir, f"daily_tasks_{date_str}.json")
 
@@ -531,8 +816,9 @@ class PlanManager:
                 return [], path, None
             return None, path, f"Plan file not found: {path}"
         try:
-            with open(path, "r") as f:
-                tasks = json.load(f)
+            with open(path, "rb") as f:
+                raw = f.read()
+            tasks = loads_json(raw)
         except Exception as exc:
             return None, path, f"Plan read failed: {exc}"
         if not isinstance(tasks, list):
@@ -540,10 +826,9 @@ class PlanManager:
         return tasks, path, None
 
     def _write_tasks(self, path: str, tasks: List[Dict]) -> Optional[str]:
-        """Persist tasks list to disk, returning error text on failure."""
+        """Persist tasks list to disk atomically, returning error text on failure."""
         try:
-            with open(path, "w") as f:
-                json.dump(tasks, f, ensure_ascii=False, indent=2)
+            write_json_atomic(path, tasks)
             return None
         except Exception as exc:
             return str(exc)
@@ -554,32 +839,7 @@ class PlanManager:
         """Parse common formats into tz-aware datetime."""
         if not raw_value or not isinstance(raw_value, str):
             return None
-        value = raw_value.strip()
-        tzinfo = datetime.datetime.now().astimezone().tzinfo
-
-        try:
-            dt = datetime.datetime.fromisoformat(value.replace("T", " "))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=tzinfo)
-            return dt.astimezone(tzinfo)
-        except Exception:
-            pass
-
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-            try:
-                dt = datetime.datetime.strptime(value, fmt)
-                return dt.replace(tzinfo=tzinfo)
-            except ValueError:
-                continue
-
-        for fmt in ("%H:%M:%S", "%H:%M"):
-            try:
-                t = datetime.datetime.strptime(value, fmt).time()
-                return datetime.datetime.combine(plan_date, t).replace(tzinfo=tzinfo)
-            except ValueError:
-                continue
-
-        return None
+        return _parse_dt_cached(raw_value.strip(), plan_date, self._local_tz)
 
     def _find_task(self, tasks: List[Dict], task_id: str) -> Optional[Dict]:
         """Find task by id, title, or index (1-based string)."""
@@ -621,30 +881,28 @@ class PlanManager:
                 conflicts.append(task)
         return conflicts
 
-    def _normalize_for_summary(
+    def _iter_sorted_tasks(
         self, tasks: List[Dict], plan_date: datetime.date
-    ) -> List[Dict]:
-        """Sort for summary and include parsed times."""
-        normalized = []
+    ) -> Iterator[Tuple[Optional[datetime.datetime], Optional[datetime.datetime], Dict]]:
+        """Yield (start_dt, end_dt, task) in start order; unparseable starts sort last."""
+        if len(tasks) < 2:
+            # Nothing to order: skip building and sorting the rows.
+            for task in tasks:
+                yield (
+                    self._normalize_to_dt(task.get("start"), plan_date),
+                    self._normalize_to_dt(task.get("end"), plan_date),
+                    task,
+                )
+            return
+        tz_max = self._tz_max
+        rows = []
         for task in tasks:
             start_dt = self._normalize_to_dt(task.get("start"), plan_date)
             end_dt = self._normalize_to_dt(task.get("end"), plan_date)
-            normalized.append(
-                {
-                    **task,
-                    "start_dt": start_dt,
-                    "end_dt": end_dt,
-                    "raw_start": task.get("start"),
-                    "raw_end": task.get("end"),
-                }
-            )
-        normalized.sort(
-            key=lambda t: t.get("start_dt")
-            or datetime.datetime.max.replace(
-                tzinfo=datetime.datetime.now().astimezone().tzinfo
-            )
-        )
-        return normalized
+            rows.append((start_dt or tz_max, start_dt, end_dt, task))
+        rows.sort(key=itemgetter(0))
+        for _, start_dt, end_dt, task in rows:
+            yield start_dt, end_dt, task
 
     def _parse_plan_date(
         self, target_date: Optional[Union[str, datetime.date]], today: datetime.date
@@ -676,19 +934,7 @@ class PlanManager:
         """Extract date component from a datetime string if present."""
         if not value or not isinstance(value, str):
             return None
-        text = value.strip()
-        try:
-            dt = datetime.datetime.fromisoformat(text.replace("T", " "))
-            return dt.date()
-        except Exception:
-            pass
-        match = re.search(r"(\d{4}-\d{2}-\d{2})", text)
-        if match:
-            try:
-                return datetime.datetime.strptime(match.group(1), "%Y-%m-%d").date()
-            except ValueError:
-                return None
-        return None
+        return _extract_date_cached(value.strip())
 
     def _determine_plan_date(
         self,
@@ -701,22 +947,27 @@ class PlanManager:
         if date_err:
             return plan_date, date_err
 
-        explicit_dates = []
+        # Single pass: the first explicit date picks the plan (unless target_date
+        # did), and the first date that disagrees ends the scan.
+        plan_fixed = bool(target_date)
+        seen_dates = set()
         for task in tasks:
+            if not isinstance(task, dict):
+                continue
             for key in ("start", "end"):
                 detected = self._extract_date_from_text(task.get(key))
-                if detected and detected not in explicit_dates:
-                    explicit_dates.append(detected)
-
-        if explicit_dates:
-            if not target_date:
-                plan_date = explicit_dates[0]
-            if any(d != plan_date for d in explicit_dates):
-                dates_text = ", ".join(sorted({d.isoformat() for d in explicit_dates}))
-                return (
-                    plan_date,
-                    f"Tasks span multiple dates: {dates_text}. Split them or set a single target_date.",
-                )
+                if not detected:
+                    continue
+                if not plan_fixed:
+                    plan_date = detected
+                    plan_fixed = True
+                seen_dates.add(detected)
+                if detected != plan_date:
+                    dates_text = ", ".join(sorted(d.isoformat() for d in seen_dates))
+                    return (
+                        plan_date,
+                        f"Tasks span multiple dates: {dates_text}. Split them or set a single target_date.",
+                    )
 
         return plan_date, None
 
@@ -772,15 +1023,7 @@ class PlanManager:
         """Normalize stored 'YYYY-MM-DD HH:MM' to ISO-like 'YYYY-MM-DDTHH:MM:SS'."""
         if not value or not isinstance(value, str):
             return None
-        text = value.strip()
-        if "T" not in text and " " in text:
-            text = text.replace(" ", "T")
-        if "T" not in text:
-            return text
-        # Ensure seconds are present to satisfy GoogleCalendar parser
-        if len(text.split("T", 1)[1]) == 5:
-            text = f"{text}:00"
-        return text
+        return _calendar_time_cached(value.strip())
 
     def _extract_event_id(self, response: Union[str, Dict]) -> Optional[str]:
         """Best-effort extraction of event id from ConnectOnion GoogleCalendar responses."""
@@ -792,10 +1035,10 @@ class PlanManager:
         if not response:
             return None
         text = str(response)
-        match = re.search(r"Event ID:\s*([^\s]+)", text)
+        match = _EVENT_ID_RE.search(text)
         if match:
             return match.group(1).strip()
-        match = re.search(r"Event deleted:\s*([^\s]+)", text)
+        match = _EVENT_DEL_RE.search(text)
         if match:
             return match.group(1).strip()
         return None
@@ -820,8 +1063,33 @@ class PlanManager:
         pending = 0
         errors: List[str] = []
 
-        for task, action in items:
-            synced, event_id, sync_msg = self._sync_calendar(task, action)
+        if items and not self._calendar_enabled:
+            # Fast path: nothing to call, every item simply stays pending.
+            debug_log(
+                f"[Calendar] Not configured or invalid type: {type(self.calendar)}"
+                f"; {len(items)} task(s) left pending"
+            )
+            for task, _ in items:
+                task["sync_status"] = task.get("sync_status") or "pending"
+            self._record_sync_summary(len(items), 0, 0, len(items))
+            return 0, 0, len(items), errors
+
+        if items and not self._calendar_ready():
+            for task, _ in items:
+                task["sync_status"] = task.get("sync_status") or "pending"
+            self._record_sync_summary(len(items), 0, 0, len(items))
+            return 0, 0, len(items), errors
+
+        # Resolve every request up front, then dispatch them back to back, or
+        # concurrently when ADHD_CALENDAR_SYNC_WORKERS opts into a pool.
+        requests = [self._calendar_request(task, action) for task, action in items]
+        executor = _calendar_executor() if len(requests) > 1 else None
+        if executor:
+            results = list(executor.map(self._dispatch_calendar, requests))
+        else:
+            results = [self._dispatch_calendar(request) for request in requests]
+
+        for (task, _), (synced, event_id, sync_msg) in zip(items, results):
             if event_id:
                 task["google_event_id"] = event_id
 
@@ -851,38 +1119,53 @@ class PlanManager:
         Try syncing to Google Calendar; never raise on failure.
         Returns (success, event_id, message); action: create/update/delete.
         """
-        title = task.get("title") or task.get("id") or "Untitled task"
-        event_id = task.get("google_event_id")
-        start = task.get("start")
-        end = task.get("end")
-
-        # 1) Defensive validation
-        if not self.calendar or isinstance(self.calendar, str):
+        if not self._calendar_ready():
+            return False, task.get("google_event_id"), ""
+        return self._dispatch_calendar(self._calendar_request(task, action))
+
+    def _calendar_ready(self) -> bool:
+        """Check the calendar can be called, upgrading a fallback stub if possible."""
+        # Flags are precomputed by the calendar setter
+        if not self._calendar_enabled:
             debug_log(f"[Calendar] Not configured or invalid type: {type(self.calendar)}")
-            return False, event_id, ""
-        if hasattr(self.calendar, "reason"):
+            return False
+        if self._calendar_is_fallback:
             try:
                 from connectonion import GoogleCalendar
 
                 self.calendar = GoogleCalendar()
             except Exception:
                 debug_log(f"[Calendar] Fallback mode: {self.calendar.reason}")
-                return False, event_id, ""
+                return False
+        return True
+
+    def _calendar_request(self, task: Dict, action: str) -> CalendarRequest:
+        """Snapshot what a sync call needs: (action, event_id, title, iso_start, iso_end)."""
+        return (
+            action,
+            task.get("google_event_id"),
+            task.get("title") or task.get("id") or "Untitled task",
+            self._format_calendar_time(task.get("start")),
+            self._format_calendar_time(task.get("end")),
+        )
 
-        iso_start = self._format_calendar_time(start)
-        iso_end = self._format_calendar_time(end)
+    def _dispatch_calendar(
+        self, request: CalendarRequest
+    ) -> Tuple[bool, Optional[str], str]:
+        """Issue one calendar call for a prepared request; never raises."""
+        action, event_id, title, iso_start, iso_end = request
         if action in {"create", "update"} and (not iso_start or not iso_end):
             debug_log(
-                f"[Calendar] Invalid time format; skip sync: {title} | {start}-{end} ({action})"
+                f"[Calendar] Invalid time format; skip sync: {title} | {iso_start}-{iso_end} ({action})"
             )
             return False, event_id, ""
 
-        # 2. Delete old event (for conflict cleanup)
+        # Delete old event (for conflict cleanup)
         if action == "delete":
             if not event_id:
                 debug_log(f"[Calendar] Skip delete: no event_id for {title}")
                 return False, None, ""
-            if not hasattr(self.calendar, "delete_event"):
+            if not self._calendar_has_delete:
                 debug_log("[Calendar] Calendar lacks delete_event method")
                 return False, event_id, ""
             try:
@@ -891,63 +1174,102 @@ class PlanManager:
                 except TypeError:
                     resp = self.calendar.delete_event(event_id)
                 debug_log(f"[Calendar] ✅ Delete ok {event_id} | response: {resp}")
+                self._last_sync.pop(event_id, None)
                 return True, None, ""
             except Exception as exc:
                 debug_log(f"[Calendar] ❌ Delete failed {event_id}: {exc}")
                 return False, event_id, f", but calendar sync failed: {exc}"
 
-        # 3) Create event
-        def _create_event() -> Tuple[bool, Optional[str], str]:
-            if not hasattr(self.calendar, "create_event"):
-                debug_log("[Calendar] Calendar lacks create_event method")
-                return False, event_id, ""
-            try:
+        # Update event; fallback to create on failure
+        if action == "update" and event_id and self._calendar_has_update:
+            signature = (title, iso_start, iso_end)
+            if self._last_sync.get(event_id) == signature:
+                debug_log(f"[Calendar] Unchanged since last sync; skip update {title} ({event_id})")
+                return True, event_id, " (calendar already up to date)"
+            # Retry transient failures with backoff; recreate only if the event is gone.
+            for attempt in range(_UPDATE_TRIES):
                 try:
-                    resp = self.calendar.create_event(
-                        title=title, start_time=iso_start, end_time=iso_end
-                    )
-                except TypeError:
-                    resp = self.calendar.create_event(
-                        title=title, start=iso_start, end=iso_end
-                    )
+                    resp = self._calendar_update(event_id, title, iso_start, iso_end)
+                except Exception as exc:
+                    if _is_transient_error(exc) and attempt + 1 < _UPDATE_TRIES:
+                        debug_log(
+                            f"[Calendar] Update attempt {attempt + 1} failed, retrying {title} ({event_id}): {exc}"
+                        )
+                        time.sleep(_UPDATE_BACKOFF * 2**attempt)
+                        continue
+                    if _is_not_found_error(exc):
+                        debug_log(
+                            f"[Calendar] Event missing, recreate {title} ({event_id}): {exc}"
+                        )
+                        return self._calendar_create(title, iso_start, iso_end, event_id)
+                    debug_log(f"[Calendar] ❌ Update failed {title} ({event_id}): {exc}")
+                    return False, event_id, f", but calendar sync failed: {exc}"
                 new_id = self._extract_event_id(resp) or event_id
                 debug_log(
-                    f"[Calendar] ✅ Create ok {title} | id={new_id} | response: {resp}"
+                    f"[Calendar] ✅ Update ok {title} | id={new_id} | response: {resp}"
                 )
+                self._last_sync[new_id] = signature
                 return True, new_id, " and synced to calendar"
-            except Exception as exc:
-                debug_log(
-                    f"[Calendar] ❌ Create failed {title} {iso_start}-{iso_end}: {exc}"
-                )
-                return False, event_id, f", but calendar sync failed: {exc}"
 
-        # 4) Update event; fallback to create on failure
-        if action == "update" and event_id and hasattr(self.calendar, "update_event"):
-            try:
+        # Default to create
+        return self._calendar_create(title, iso_start, iso_end, event_id)
+
+    def _calendar_update(
+        self, event_id: str, title: str, iso_start: str, iso_end: str
+    ) -> Any:
+        """Call update_event with whichever keyword style the calendar accepts."""
+        style = self._calendar_update_style
+        if style:
+            by_keyword, start_key, end_key = style
+            kwargs = {"title": title, start_key: iso_start, end_key: iso_end}
+            if by_keyword:
+                return self.calendar.update_event(event_id=event_id, **kwargs)
+            return self.calendar.update_event(event_id, **kwargs)
+        # Signature unknown; probe both styles.
+        try:
+            return self.calendar.update_event(
+                event_id=event_id,
+                title=title,
+                start_time=iso_start,
+                end_time=iso_end,
+            )
+        except TypeError:
+            return self.calendar.update_event(
+                event_id,
+                title=title,
+                start=iso_start,
+                end=iso_end,
+            )
+
+    def _calendar_create(
+        self, title: str, iso_start: str, iso_end: str, event_id: Optional[str]
+    ) -> Tuple[bool, Optional[str], str]:
+        """Create a calendar event; same return shape as _sync_calendar."""
+        if not self._calendar_has_create:
+            debug_log("[Calendar] Calendar lacks create_event method")
+            return False, event_id, ""
+        try:
+            time_kwargs = self._calendar_time_kwargs
+            if time_kwargs:
+                start_key, end_key = time_kwargs
+                resp = self.calendar.create_event(
+                    title=title, **{start_key: iso_start, end_key: iso_end}
+                )
+            else:
+                # Signature unknown; probe both keyword styles.
                 try:
-                    resp = self.calendar.update_event(
-                        event_id=event_id,
-                        title=title,
-                        start_time=iso_start,
-                        end_time=iso_end,
+                    resp = self.calendar.create_event(
+                        title=title, start_time=iso_start, end_time=iso_end
                     )
                 except TypeError:
-                    resp = self.calendar.update_event(
-                        event_id,
-                        title=title,
-                        start=iso_start,
-                        end=iso_end,
+                    resp = self.calendar.create_event(
+                        title=title, start=iso_start, end=iso_end
                     )
-                new_id = self._extract_event_id(resp) or event_id
-                debug_log(
-                    f"[Calendar] ✅ Update ok {title} | id={new_id} | response: {resp}"
-                )
-                return True, new_id, " and synced to calendar"
-            except Exception as exc:
-                debug_log(
-                    f"[Calendar] Update failed, retry create {title} ({event_id}): {exc}"
-                )
-                return _create_event()
-
-        # Default to create
-        return _create_event()
+            new_id = self._extract_event_id(resp) or event_id
+            debug_log(f"[Calendar] ✅ Create ok {title} | id={new_id} | response: {resp}")
+            if new_id:
+                self._last_sync[new_id] = (title, iso_start, iso_end)
+            return True, new_id, " and synced to calendar"
+        except Exception as exc:
+            debug_log(f"[Calendar] ❌ Create failed {title} {iso_start}-{iso_end}: {exc}")
+            return False, event_id, f", but calendar sync failed: {exc}"
@@ -1,10 +1,12 @@
 """Reward toolkit: cowsay-based ASCII rewards and daily summary logging."""
 
 import datetime
+import functools
+import io
 import os
 import random
 import textwrap
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from core.paths import resolve_data_root
 try:  # Optional dependency
@@ -14,7 +16,7 @@ except Exception:  # pragma: no cover - defensive fallback
 
 
 # Lightweight praise phrases to avoid calling the LLM every time.
-MICRO_PHRASES = [
+MICRO_PHRASES: Tuple[str, ...] = (
     "Full power, target hit!",
     "Nice work, dopamine +1.",
     "Cooldown complete, next level!",
@@ -23,18 +25,69 @@ MICRO_PHRASES = [
     "One clean strike, slick and sharp.",
     "Progress bar unlocked, +1.",
     "Loot drop: confidence +5.",
-]
+)
 
-MACRO_PHRASES = [
+MACRO_PHRASES: Tuple[str, ...] = (
     "Main quest cleared, claim your loot.",
     "Full-day run complete, XP surged!",
     "Boss down. Collect your rewards.",
     "Epic moment. Raise the banner.",
-]
+)
 
 # cowsay small and large/rare character lists (filtered at runtime for availability).
-SMALL_CHARACTERS = ["cow", "kitty", "pig", "turtle", "turkey", "fox", "cheese", "daemon", "octopus"]
-BIG_CHARACTERS = ["dragon", "stegosaurus", "tux", "trex"]
+SMALL_CHARACTERS: Tuple[str, ...] = (
+    "cow", "kitty", "pig", "turtle", "turkey", "fox", "cheese", "daemon", "octopus",
+)
+BIG_CHARACTERS: Tuple[str, ...] = ("dragon", "stegosaurus", "tux", "trex")
+
+# Private generator so reward picks don't share state with other random.* users.
+_RNG = random.Random()
+
+# Resolved once at import; every toolkit instance shares them.
+_HAS_COWSAY = cowsay is not None
+_AVAILABLE_CHARS = (
+    frozenset(getattr(cowsay, "char_names", SMALL_CHARACTERS)) if cowsay else frozenset()
+)
+# get_output_string is the official python-cowsay API; some versions only export
+# same-named per-character functions, so look those up as the fallback.
+_COW_RENDER_FN = getattr(cowsay, "get_output_string", None) if cowsay else None
+if not callable(_COW_RENDER_FN):
+    _COW_RENDER_FN = None
+_COW_CHAR_FNS = {
+    name: fn
+    for name in _AVAILABLE_CHARS
+    if callable(fn := getattr(cowsay, name, None))
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cow(character: str, text: str) -> Optional[str]:
+    """Cowsay output for (character, text), or None if cowsay cannot render it."""
+    try:
+        if _COW_RENDER_FN is not None:
+            return _COW_RENDER_FN(character, text)
+        cow_fn = _COW_CHAR_FNS.get(character)
+        if cow_fn is not None:
+            return cow_fn(text)
+    except Exception:
+        pass  # Caller uses the fallback bubble
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _wrap_cached(text: str, width: int = 48) -> str:
+    """textwrap.fill for reward text; phrases and task names repeat all day."""
+    return textwrap.fill(text.strip(), width=width)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_bubble(text: str) -> str:
+    """Fallback bubble rendering when cowsay is unavailable."""
+    lines = _wrap_cached(text).splitlines() or [text]
+    width = max(map(len, lines))
+    rule = width + 2
+    body = "\n".join([f"| {line:<{width}} |" for line in lines])
+    return f" {'_' * rule}\n{body}\n {'-' * rule}\n (•ᴗ•)つ━☆・*"
 
 
 class RewardToolkit:
@@ -43,24 +96,29 @@ class RewardToolkit:
     def __init__(self, brain_dir: Optional[str] = None, log_dir: Optional[str] = None):
         self.brain_dir = brain_dir or resolve_data_root()
         self.log_dir = log_dir or os.path.join(self.brain_dir, "logs")
-        os.makedirs(self.log_dir, exist_ok=True)
-
-        self._has_cowsay = cowsay is not None
-        self._available_chars = set(getattr(cowsay, "char_names", SMALL_CHARACTERS)) if cowsay else set()
+        # Created on the first summary write; most toolkits only render rewards.
+        self._log_dir_ready = False
+
+        self._has_cowsay = _HAS_COWSAY
+        self._available_chars = _AVAILABLE_CHARS
+        # ADHD_REWARD_FAST=1 (tests, stress runs) renders the built-in bubble only.
+        self._use_cowsay = self._has_cowsay and os.getenv("ADHD_REWARD_FAST") != "1"
+        # Character pools are fixed per process; filter them once, not per reward.
+        any_pool = tuple(self._filter_available(SMALL_CHARACTERS + BIG_CHARACTERS)) or ("cow",)
+        self._small_pool = tuple(self._filter_available(SMALL_CHARACTERS)) or any_pool
+        self._big_pool = tuple(self._filter_available(BIG_CHARACTERS)) or any_pool
 
     # -- Public methods ------------------------------------------------
 
     def get_random_character(self, is_big: bool = False) -> str:
         """Return a random cowsay character, optionally favoring large ones."""
-        pool = self._filter_available(BIG_CHARACTERS if is_big else SMALL_CHARACTERS)
-        if not pool:  # Fall back to all characters, then default cow.
-            pool = self._filter_available(SMALL_CHARACTERS + BIG_CHARACTERS) or ["cow"]
-        return random.choice(pool)
+        # Empty pools already fell back to all characters, then default cow.
+        return _RNG.choice(self._big_pool if is_big else self._small_pool)
 
     def get_hype_phrase(self, is_macro: bool = False) -> str:
         """Return a random hype phrase; macro uses MACRO, otherwise MICRO."""
         pool = MACRO_PHRASES if is_macro else MICRO_PHRASES
-        return random.choice(pool)
+        return _RNG.choice(pool)
 
     def generate_micro_reward(self, task_name: Optional[str] = None) -> str:
         """
@@ -86,28 +144,36 @@ class RewardToolkit:
         """Persist daily summary to disk and return the saved path."""
         date_str = plan_date.isoformat()
         path = os.path.join(self.log_dir, f"daily_summary_{date_str}.md")
-        lines = [
-            f"# Daily Summary {date_str}",
-            "",
-            summary_text.strip(),
-        ]
+        if not self._log_dir_ready:
+            os.makedirs(self.log_dir, exist_ok=True)
+            self._log_dir_ready = True
+        summary = summary_text.strip()
         tasks = completed_tasks or []
+        # Every piece ends in its own newline, so no trailing-whitespace trim is needed.
+        buf = io.StringIO()
+        buf.write(f"# Daily Summary {date_str}\n")
+        if summary or tasks:
+            buf.write(f"\n{summary}\n")
         if tasks:
-            lines.append("")
-            lines.append("## Completed Tasks")
+            buf.write("\n## Completed Tasks\n")
             for task in tasks:
                 title = task.get("title") or task.get("id") or "Task"
                 start = task.get("start") or "-"
                 end = task.get("end") or "-"
-                lines.append(f"- {title} ({start} - {end})")
-        content = "\n".join(lines).rstrip() + "\n"
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+                buf.write(f"- {title} ({start} - {end})\n")
+        content = buf.getvalue()
+        self._write_summary(path, content.encode("utf-8"))
         return path
 
     # -- Internal methods ---------------------------------------------
 
-    def _filter_available(self, candidates: List[str]) -> List[str]:
+    @staticmethod
+    def _write_summary(path: str, data: bytes) -> None:
+        """Replace the summary file with the encoded content in one binary write."""
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def _filter_available(self, candidates: Tuple[str, ...]) -> List[str]:
         if not self._has_cowsay:
             return candidates
         return [c for c in candidates if c in self._available_chars]
@@ -115,30 +181,12 @@ class RewardToolkit:
     def _render(self, text: str, is_big: bool = False) -> str:
         """Render with cowsay when available; otherwise use a simple bubble."""
         character = self.get_random_character(is_big=is_big)
-        if self._has_cowsay:
-            try:
-                # get_output_string is the official python-cowsay API
-                render_fn = getattr(cowsay, "get_output_string", None)
-                if callable(render_fn):
-                    return render_fn(character, text)
-                # Fall back to same-named function (some versions export it as an attr)
-                cow_fn = getattr(cowsay, character, None)
-                if callable(cow_fn):
-                    return cow_fn(text)
-            except Exception:
-                pass  # Continue to fallback
+        if self._use_cowsay:
+            output = _render_cow(character, text)
+            if output is not None:
+                return output
         return self._render_fallback(text)
 
     def _render_fallback(self, text: str) -> str:
         """Fallback bubble rendering when cowsay is unavailable."""
-        wrapped = self._wrap(text)
-        lines = wrapped.splitlines() or [text]
-        width = max(len(line) for line in lines)
-        top = " " + "_" * (width + 2)
-        bottom = " " + "-" * (width + 2)
-        bubble = "\n".join([f"| {line.ljust(width)} |" for line in lines])
-        return f"{top}\n{bubble}\n{bottom}\n (•ᴗ•)つ━☆・*"
-
-    @staticmethod
-    def _wrap(text: str, width: int = 48) -> str:
-        return textwrap.fill(text.strip(), width=width)
+        return _render_bubble(text)
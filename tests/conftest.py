@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def data_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("adhd_data"))
+
+
+@pytest.fixture(scope="session")
+def app(data_dir):
+    # Imported here so tests that don't need the server (and its FastAPI
+    # stack) still collect when those requirements are missing.
+    from server import create_app
+
+    # One app per session; create_app wires every router, so tests share it.
+    return create_app(data_dir=data_dir)
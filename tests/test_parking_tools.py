@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+
+import pytest
+
+from tools import parking_tools
+from tools.parking_tools import ParkingService
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    services = []
+
+    def _make():
+        service = ParkingService(brain_dir=str(tmp_path))
+        services.append(service)
+        return service
+
+    yield _make
+    for service in services:
+        service.close()
+
+
+def _counting_search(calls):
+    def search(query_text):
+        calls.append(query_text)
+        return f"{parking_tools._SEARCH_HEADER}\n1. {query_text}"
+
+    return search
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_identical_in_flight_queries_share_one_search(make_service):
+    service = make_service()
+    calls = []
+    release = threading.Event()
+
+    def blocking_search(query_text):
+        calls.append(query_text)
+        release.wait(5)
+        return f"{parking_tools._SEARCH_HEADER}\n1. {query_text}"
+
+    service._internet_search = blocking_search
+    service.dispatch_task("focus music")
+    service.dispatch_task("  Focus Music ")
+    # Both tasks are processing while the first search is still blocked.
+    assert _wait_for(
+        lambda: [t["status"] for t in service._load_tasks()] == ["processing"] * 2
+    )
+    release.set()
+
+    assert _wait_for(
+        lambda: all(t["status"] == "completed" for t in service._load_tasks())
+    )
+    assert calls == ["focus music"]
+    results = {t["result"] for t in service._load_tasks()}
+    assert results == {f"{parking_tools._SEARCH_HEADER}\n1. focus music"}
+
+
+def test_urls_differing_only_in_path_case_are_fetched_separately(make_service):
+    service = make_service()
+    fetched = []
+    release = threading.Event()
+
+    def blocking_fetch(url):
+        fetched.append(url)
+        release.wait(5)
+        return f"summary of {url}"
+
+    service._fetch_with_webfetch = blocking_fetch
+    service.dispatch_task("https://example.com/Docs/A")
+    service.dispatch_task("https://example.com/docs/a")
+    assert _wait_for(
+        lambda: [t["status"] for t in service._load_tasks()] == ["processing"] * 2
+    )
+    release.set()
+
+    assert _wait_for(
+        lambda: all(t["status"] == "completed" for t in service._load_tasks())
+    )
+    assert sorted(fetched) == ["https://example.com/Docs/A", "https://example.com/docs/a"]
+    for task in service._load_tasks():
+        assert task["result"] == f"summary of {task['content']}"
+
+
+def test_search_cache_serves_repeat_query_from_disk(make_service):
+    calls = []
+    first = make_service()
+    first._internet_search = _counting_search(calls)
+    result = first._perform_search("pomodoro timer")
+
+    # A fresh instance has no in-memory state, so a hit must come from disk.
+    second = make_service()
+    second._internet_search = _counting_search(calls)
+    assert second._perform_search("Pomodoro Timer") == result
+    assert calls == ["pomodoro timer"]
+
+
+def test_search_cache_prunes_expired_entries_on_write(make_service):
+    service = make_service()
+    service._internet_search = _counting_search([])
+    service._perform_search("old query")
+    stale = service._search_cache_path("old query")
+    expired = time.time() - parking_tools._SEARCH_CACHE_TTL - 60
+    os.utime(stale, (expired, expired))
+
+    service._perform_search("new query")
+
+    assert not os.path.exists(stale)
+    assert os.path.exists(service._search_cache_path("new query"))
+
+
+def test_concurrent_services_do_not_lose_appended_tasks(make_service):
+    services = [make_service(), make_service()]
+    per_thread = 25
+    start = threading.Barrier(4)
+
+    def append_many(service, prefix):
+        start.wait()
+        for i in range(per_thread):
+            service.dispatch_task(f"{prefix}-{i}", task_type="note", run_async=False)
+
+    threads = [
+        threading.Thread(target=append_many, args=(services[n % 2], f"t{n}"))
+        for n in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Each instance locks the shared store on its own; none may drop a write.
+    for service in services:
+        contents = sorted(t["content"] for t in service._load_tasks())
+        assert contents == sorted(
+            f"t{n}-{i}" for n in range(4) for i in range(per_thread)
+        )
+
+
+def test_session_summary_keeps_tasks_interleaved_with_an_older_session(make_service):
+    older, newer = make_service(), make_service()
+    older._session_id = "20260314_090000"
+    newer._session_id = "20260314_091500"
+
+    newer.dispatch_task("call the dentist", task_type="note", run_async=False)
+    older.dispatch_task("buy milk", task_type="note", run_async=False)
+    newer.dispatch_task("email Sam", task_type="note", run_async=False)
+
+    summary = newer.get_session_summary()
+    assert "call the dentist" in summary
+    assert "email Sam" in summary
+    assert "buy milk" not in summary
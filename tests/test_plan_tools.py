@@ -0,0 +1,172 @@
+import datetime
+import json
+
+import pytest
+
+from tools import plan_tools_v2
+from tools.plan_tools_v2 import PlanManager
+
+
+@pytest.fixture
+def plan_date():
+    # Tomorrow, so nothing in the plan is rejected as being in the past.
+    return (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    # debug_log writes under the data root; keep it out of the source tree.
+    monkeypatch.setenv("ADHD_DATA_DIR", str(tmp_path))
+    return PlanManager(plan_dir=str(tmp_path))
+
+
+def _task(task_id, start, end, day, title=None):
+    return {
+        "id": task_id,
+        "title": title or task_id.upper(),
+        "start": f"{day} {start}",
+        "end": f"{day} {end}",
+    }
+
+
+def _read_plan(manager, day):
+    with open(manager._plan_path(day), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _count_writes(manager, monkeypatch):
+    writes = []
+    real_write = manager._write_tasks
+
+    def counting_write(path, tasks):
+        writes.append(path)
+        return real_write(path, tasks)
+
+    monkeypatch.setattr(manager, "_write_tasks", counting_write)
+    return writes
+
+
+def test_create_daily_plan_skips_write_when_nothing_changed(manager, plan_date, monkeypatch):
+    tasks = [_task("a", "09:00", "10:00", plan_date), _task("b", "11:00", "12:00", plan_date)]
+    manager.create_daily_plan(tasks, plan_date)
+    writes = _count_writes(manager, monkeypatch)
+
+    result = manager.create_daily_plan(tasks, plan_date)
+
+    assert result.startswith(f"✅ Plan already up to date (date: {plan_date}); no changes written.")
+    assert writes == []
+
+
+def test_create_daily_plan_writes_real_changes(manager, plan_date, monkeypatch):
+    manager.create_daily_plan([_task("a", "09:00", "10:00", plan_date)], plan_date)
+    writes = _count_writes(manager, monkeypatch)
+
+    result = manager.create_daily_plan(
+        [_task("a", "09:00", "10:30", plan_date, title="A revised")], plan_date
+    )
+
+    assert result.startswith("✅ Plan updated")
+    assert writes == [manager._plan_path(plan_date)]
+    (task,) = _read_plan(manager, plan_date)
+    assert (task["title"], task["end"]) == ("A revised", f"{plan_date} 10:30")
+
+
+class _HttpError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status_code = status
+
+
+class FakeCalendar:
+    """Calendar double whose update_event raises the scripted errors in order."""
+
+    def __init__(self, update_errors=()):
+        self.update_errors = list(update_errors)
+        self.updates = []
+        self.creates = []
+
+    def create_event(self, title, start_time, end_time):
+        self.creates.append(title)
+        return {"id": f"new-{len(self.creates)}"}
+
+    def update_event(self, event_id, title, start_time, end_time):
+        self.updates.append(event_id)
+        if self.update_errors:
+            raise self.update_errors.pop(0)
+        return {"id": event_id}
+
+
+@pytest.fixture
+def synced_plan(manager, plan_date, monkeypatch):
+    """A plan with one task already linked to calendar event evt-1."""
+    monkeypatch.setattr(plan_tools_v2, "_UPDATE_BACKOFF", 0.001)
+    task = {**_task("a", "09:00", "10:00", plan_date), "google_event_id": "evt-1"}
+    manager._write_tasks(manager._plan_path(plan_date), [task])
+
+    def reschedule(calendar):
+        manager.calendar = calendar
+        result = manager.update_schedule(
+            "a", f"{plan_date} 10:00", f"{plan_date} 11:00", target_date=plan_date
+        )
+        (stored,) = _read_plan(manager, plan_date)
+        return result, stored
+
+    return reschedule
+
+
+def test_calendar_update_retries_transient_error_then_succeeds(synced_plan):
+    calendar = FakeCalendar([_HttpError(503), TimeoutError("slow")])
+
+    result, stored = synced_plan(calendar)
+
+    assert calendar.updates == ["evt-1"] * 3
+    assert calendar.creates == []
+    assert "synced to calendar" in result
+    assert (stored["sync_status"], stored["google_event_id"]) == ("success", "evt-1")
+
+
+def test_calendar_update_recreates_missing_event(synced_plan):
+    calendar = FakeCalendar([_HttpError(404)])
+
+    result, stored = synced_plan(calendar)
+
+    assert calendar.updates == ["evt-1"]
+    assert calendar.creates == ["A"]
+    assert (stored["sync_status"], stored["google_event_id"]) == ("success", "new-1")
+
+
+def test_calendar_update_other_error_marks_sync_failed(synced_plan):
+    calendar = FakeCalendar([_HttpError(403)])
+
+    result, stored = synced_plan(calendar)
+
+    assert calendar.updates == ["evt-1"]
+    assert calendar.creates == []
+    assert "calendar sync failed: HTTP 403" in result
+    assert (stored["sync_status"], stored["google_event_id"]) == ("failed", "evt-1")
+
+
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_create_daily_plan_dedupes_hand_edited_plan_for_any_batch_size(
+    manager, plan_date, batch_size
+):
+    manager._write_tasks(
+        manager._plan_path(plan_date),
+        [
+            _task("a", "08:00", "08:30", plan_date),
+            _task("a", "09:00", "09:30", plan_date),
+            _task("b", "10:00", "10:30", plan_date),
+        ],
+    )
+    new_tasks = [_task("c", "12:00", "12:30", plan_date), _task("d", "13:00", "13:30", plan_date)]
+
+    manager.create_daily_plan(new_tasks[:batch_size], plan_date)
+
+    plan = _read_plan(manager, plan_date)
+    # The later duplicate wins, as in the original merge.
+    assert [(t["id"], t["start"][11:]) for t in plan][:3] == [
+        ("a", "09:00"),
+        ("b", "10:00"),
+        ("c", "12:00"),
+    ]
+    assert len(plan) == 2 + batch_size
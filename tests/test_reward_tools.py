@@ -0,0 +1,187 @@
+import datetime
+import os
+
+import pytest
+
+from tools import reward_tools
+from tools.reward_tools import RewardToolkit
+
+DAY = datetime.date(2026, 3, 14)
+
+
+@pytest.fixture
+def toolkit(tmp_path):
+    return RewardToolkit(brain_dir=str(tmp_path))
+
+
+@pytest.fixture
+def first_choice(monkeypatch):
+    # Pin phrase and character picks to the first entry of each pool.
+    monkeypatch.setattr(reward_tools._RNG, "choice", lambda seq: seq[0])
+
+
+@pytest.fixture
+def no_cowsay(monkeypatch):
+    monkeypatch.setattr(reward_tools, "_HAS_COWSAY", False)
+    monkeypatch.setattr(reward_tools, "_AVAILABLE_CHARS", frozenset())
+
+
+@pytest.fixture
+def fake_cowsay(monkeypatch):
+    """Pretend cowsay is installed; returns the (character, text) calls it got."""
+    calls = []
+
+    def render(character, text):
+        calls.append((character, text))
+        return f"<{character}> {text}"
+
+    monkeypatch.setattr(reward_tools, "_HAS_COWSAY", True)
+    monkeypatch.setattr(reward_tools, "_AVAILABLE_CHARS", frozenset({"cow", "tux"}))
+    monkeypatch.setattr(reward_tools, "_render_cow", render)
+    return calls
+
+
+def test_micro_reward_uses_fallback_bubble_without_cowsay(tmp_path, first_choice, no_cowsay):
+    toolkit = RewardToolkit(brain_dir=str(tmp_path))
+
+    assert toolkit.generate_micro_reward("  Write report ") == (
+        " ______________________________________________\n"
+        '| Done "Write report"! Full power, target hit! |\n'
+        " ----------------------------------------------\n"
+        " (•ᴗ•)つ━☆・*"
+    )
+
+
+def test_fallback_bubble_wraps_long_rewards(tmp_path, first_choice, no_cowsay):
+    toolkit = RewardToolkit(brain_dir=str(tmp_path))
+
+    assert toolkit.generate_micro_reward(
+        "Plan the quarterly offsite agenda with the team"
+    ) == (
+        " __________________________________________________\n"
+        '| Done "Plan the quarterly offsite agenda with the |\n'
+        '| team"! Full power, target hit!                   |\n'
+        " --------------------------------------------------\n"
+        " (•ᴗ•)つ━☆・*"
+    )
+
+
+def test_reward_renders_with_cowsay_when_available(tmp_path, monkeypatch, first_choice, fake_cowsay):
+    monkeypatch.delenv("ADHD_REWARD_FAST", raising=False)
+    toolkit = RewardToolkit(brain_dir=str(tmp_path))
+
+    reward = toolkit.generate_macro_reward("Shipped it.")
+
+    # "tux" is the only available big character.
+    assert reward == "<tux> Shipped it.\n—— Main quest cleared, claim your loot."
+    assert fake_cowsay == [("tux", "Shipped it.\n—— Main quest cleared, claim your loot.")]
+
+
+def test_fast_mode_skips_cowsay(tmp_path, monkeypatch, first_choice, fake_cowsay):
+    monkeypatch.setenv("ADHD_REWARD_FAST", "1")
+    toolkit = RewardToolkit(brain_dir=str(tmp_path))
+
+    reward = toolkit.generate_micro_reward("Write report")
+
+    assert fake_cowsay == []
+    assert reward.splitlines()[1] == '| Done "Write report"! Full power, target hit! |'
+
+
+def test_log_dir_is_created_on_first_summary_save(tmp_path):
+    toolkit = RewardToolkit(brain_dir=str(tmp_path))
+    toolkit.generate_micro_reward("Write report")
+    assert not os.path.exists(toolkit.log_dir)
+
+    path = toolkit.save_daily_summary(DAY, "Done.")
+
+    assert path == os.path.join(str(tmp_path), "logs", "daily_summary_2026-03-14.md")
+    assert _read(path) == "# Daily Summary 2026-03-14\n\nDone.\n"
+
+
+def test_save_daily_summary_content(toolkit):
+    path = toolkit.save_daily_summary(
+        DAY,
+        "  A steady day.  \n",
+        [
+            _task("Write", "09:00", "10:00"),
+            {"id": "t2", "start": "10:30"},
+            {},
+        ],
+    )
+
+    assert _read(path) == (
+        "# Daily Summary 2026-03-14\n"
+        "\n"
+        "A steady day.\n"
+        "\n"
+        "## Completed Tasks\n"
+        "- Write (09:00 - 10:00)\n"
+        "- t2 (10:30 - -)\n"
+        "- Task (- - -)\n"
+    )
+
+
+def test_save_daily_summary_without_summary_or_tasks(toolkit):
+    path = toolkit.save_daily_summary(DAY, "   ")
+
+    assert _read(path) == "# Daily Summary 2026-03-14\n"
+
+
+def test_save_daily_summary_tasks_without_summary_text(toolkit):
+    path = toolkit.save_daily_summary(DAY, "", [_task("Write", "09:00", "10:00")])
+
+    assert _read(path) == (
+        "# Daily Summary 2026-03-14\n"
+        "\n"
+        "\n"
+        "\n"
+        "## Completed Tasks\n"
+        "- Write (09:00 - 10:00)\n"
+    )
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _task(title, start, end):
+    return {"title": title, "start": start, "end": end}
+
+
+def test_save_daily_summary_rewrites_when_more_tasks_are_added(toolkit):
+    first = [_task("Write", "09:00", "10:00")]
+    toolkit.save_daily_summary(DAY, "Good start.", first)
+
+    path = toolkit.save_daily_summary(
+        DAY, "Good start.", first + [_task("Review", "10:30", "11:00")]
+    )
+
+    assert _read(path) == (
+        "# Daily Summary 2026-03-14\n"
+        "\n"
+        "Good start.\n"
+        "\n"
+        "## Completed Tasks\n"
+        "- Write (09:00 - 10:00)\n"
+        "- Review (10:30 - 11:00)\n"
+    )
+
+
+def test_save_daily_summary_replaces_a_longer_previous_file(toolkit):
+    toolkit.save_daily_summary(
+        DAY,
+        "First pass.",
+        [_task("Write", "09:00", "10:00"), _task("Review", "10:30", "11:00")],
+    )
+
+    path = toolkit.save_daily_summary(DAY, "Rewritten.", [_task("Write", "09:00", "10:00")])
+
+    assert _read(path) == (
+        "# Daily Summary 2026-03-14\n"
+        "\n"
+        "Rewritten.\n"
+        "\n"
+        "## Completed Tasks\n"
+        "- Write (09:00 - 10:00)\n"
+    )